@@ -27,6 +27,7 @@ AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 AWS_PROFILE = os.environ.get('AWS_PROFILE')
 PRICING_ENDPOINT = os.environ.get('PRICING_ENDPOINT')
 LOG_LEVEL = os.getenv('FASTMCP_LOG_LEVEL', 'WARNING')
+PRICING_CACHE_DIR = os.environ.get('PRICING_CACHE_DIR')
 
 # Supported AWS Pricing API regions
 PRICING_API_REGIONS = {
@@ -17,19 +17,35 @@
 This server provides models for analyzing AWS service costs.
 """
 
-from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Optional, Union
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import Any, Dict, List, Optional, Union
 
 
-class ErrorResponse(BaseModel):
-    """Generic standardized error response model for all MCP tools."""
+@dataclass(frozen=True, slots=True)
+class ErrorResponse:
+    """Generic standardized error response for all MCP tools.
 
-    status: str = Field(default='error', description='Response status')
-    error_type: str = Field(..., description='Type of error that occurred')
-    message: str = Field(..., description='Human-readable error message')
+    A slotted dataclass rather than a pydantic model: error responses are
+    produced in bursts (throttling storms, failed matrix sweeps) and carry
+    no validation needs at the response boundary, so the cheaper allocation
+    matters more than schema checking.
+    """
 
-    # Allow any additional fields to be passed dynamically
-    model_config = ConfigDict(extra='allow')
+    error_type: str
+    message: str
+    status: str = 'error'
+    # Additional fields passed dynamically (suggestions, examples, ...)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the response in the wire format returned by tools."""
+        return {
+            'status': self.status,
+            'error_type': self.error_type,
+            'message': self.message,
+            **self.extra,
+        }
 
 
 class PricingFilter(BaseModel):
@@ -46,14 +62,47 @@ class PricingFilter(BaseModel):
     )
     model_config = ConfigDict(validate_by_alias=True)
 
+    # API-format dump pre-materialized at validation time; see model_dump
+    _api_dict: Dict[str, Any] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        """Pre-materialize the default API-format dump.
+
+        Filters are re-serialized on every get_pricing call and matrix
+        sweeps reuse the same filter objects across many queries, so the
+        aliased dump is computed once here instead of reflecting on each
+        call. Callers must treat the returned dict as read-only.
+        """
+        data = super().model_dump(by_alias=True)
+        if isinstance(self.value, list):
+            data['Value'] = ','.join(self.value)
+        self._api_dict = data
+
     def model_dump(self, by_alias=True, **kwargs):
         """Override to handle comma-separated values for ANY_OF and NONE_OF filters."""
+        if by_alias and not kwargs:
+            return self._api_dict
         data = super().model_dump(by_alias=by_alias, **kwargs)
         if isinstance(self.value, list):
             data['Value'] = ','.join(self.value)
         return data
 
 
+class PricingQuery(BaseModel):
+    """A single pricing query for batched execution via get_pricing_batch."""
+
+    service_code: str = Field(
+        ..., description='AWS service code (e.g., "AmazonEC2", "AmazonS3", "AmazonES")'
+    )
+    region: Union[str, List[str]] = Field(
+        ...,
+        description='AWS region(s) - single region string (e.g., "us-east-1") or list for multi-region comparison',
+    )
+    filters: Optional[List[PricingFilter]] = Field(
+        None, description='Optional list of filters to apply to the pricing query'
+    )
+
+
 class OutputOptions(BaseModel):
     """Output filtering options for pricing responses to reduce response size."""
 
@@ -72,6 +121,11 @@ class OutputOptions(BaseModel):
         description='Filter out products with $0.00 OnDemand pricing to reduce response size',
     )
 
+    columnar: Optional[bool] = Field(
+        False,
+        description='Return results in columnar (structure-of-arrays) layout: one list per field instead of one dictionary per record. Field names are serialized once rather than per record, reducing response size for large result sets.',
+    )
+
 
 # Reusable Pydantic Field constants
 SERVICE_CODE_FIELD = Field(
@@ -115,3 +169,27 @@ NEXT_TOKEN_FIELD = Field(
     None,
     description='Pagination token from previous response to get next page of results',
 )
+
+MAX_PAGES_FIELD = Field(
+    1,
+    description='Number of result pages to fetch and concatenate automatically (default: 1). Increase for exhaustive queries instead of re-issuing calls with next_token.',
+    ge=1,
+    le=100,
+)
+
+QUERIES_FIELD = Field(
+    ...,
+    description='List of pricing queries to execute concurrently, each with service_code, region and optional filters',
+)
+
+AXES_FIELD = Field(
+    ...,
+    description='Mapping of filterable attribute name to candidate values (e.g., {"instanceType": ["t3.medium", "t3.large"], "operatingSystem": ["Linux"]}). One query is generated per combination.',
+)
+
+MAX_CONCURRENCY_FIELD = Field(
+    8,
+    description='Maximum number of queries executed concurrently (default: 8, chosen to stay under AWS Pricing API rate limits)',
+    ge=1,
+    le=32,
+)
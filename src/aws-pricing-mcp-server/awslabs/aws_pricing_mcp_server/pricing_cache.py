@@ -0,0 +1,126 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""awslabs MCP AWS Pricing mcp server pricing cache.
+
+This module provides an in-process TTL cache for AWS Price List API responses.
+Pricing data is effectively static on hour timescales, so repeated queries for
+the same (service_code, region, filters) combination - common during cost
+optimization sweeps across instance types or regions - can be served from
+memory instead of issuing redundant API round-trips.
+"""
+
+import asyncio
+import os
+from awslabs.aws_pricing_mcp_server import consts
+from cachetools import TTLCache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+# Cache sizing: 1024 entries is ample for matrix sweeps (regions x instance
+# tiers), and a 1-hour TTL keeps entries comfortably fresh relative to how
+# often AWS publishes price changes.
+PRICING_CACHE_MAXSIZE = 1024
+PRICING_CACHE_TTL_SECONDS = 3600
+
+_pricing_cache: TTLCache = TTLCache(maxsize=PRICING_CACHE_MAXSIZE, ttl=PRICING_CACHE_TTL_SECONDS)
+_pricing_cache_lock = asyncio.Lock()
+
+# Optional second-level disk cache. MCP servers restart frequently during
+# development while pricing stays stable for hours, so warm starts can be
+# served from local disk instead of AWS. Enabled only when the
+# PRICING_CACHE_DIR environment variable points at a directory and the
+# diskcache package is installed; disk entries outlive the in-memory TTL
+# but expire after a day.
+PRICING_DISK_CACHE_TTL_SECONDS = 86400
+PRICING_DISK_CACHE_SIZE_LIMIT = 500 * 1024 * 1024
+
+_disk_cache = None
+if diskcache is not None and consts.PRICING_CACHE_DIR:
+    _disk_cache = diskcache.Cache(
+        os.path.expanduser(consts.PRICING_CACHE_DIR),
+        size_limit=PRICING_DISK_CACHE_SIZE_LIMIT,
+    )
+
+
+def build_pricing_cache_key(
+    service_code: str,
+    region: Union[str, List[str]],
+    api_filters: List[Dict[str, Any]],
+    max_results: int,
+    next_token: Optional[str],
+) -> Tuple:
+    """Build a canonical cache key for a get_products request.
+
+    Filters are sorted so that logically identical queries map to the same
+    entry regardless of the order in which filters were supplied.
+
+    Args:
+        service_code: The AWS service code being queried
+        region: AWS region(s) - single region string or list of regions
+        api_filters: Filters in AWS API format ({'Field', 'Type', 'Value'} dicts)
+        max_results: Maximum number of results requested per page
+        next_token: Pagination token for the requested page, if any
+
+    Returns:
+        Hashable tuple uniquely identifying the request
+    """
+    region_key = tuple(region) if isinstance(region, list) else region
+    filter_key = tuple(sorted((f['Field'], f['Type'], f['Value']) for f in api_filters))
+    return (service_code, region_key, filter_key, max_results, next_token)
+
+
+async def get_cached_pricing(cache_key: Tuple) -> Optional[Dict[str, Any]]:
+    """Look up a cached get_products response.
+
+    Args:
+        cache_key: Key built by build_pricing_cache_key()
+
+    Returns:
+        The cached response dictionary, or None on a cache miss
+    """
+    async with _pricing_cache_lock:
+        entry = _pricing_cache.get(cache_key)
+        if entry is None and _disk_cache is not None:
+            entry = _disk_cache.get(cache_key)
+            if entry is not None:
+                # Promote disk hits so subsequent lookups skip the disk read
+                _pricing_cache[cache_key] = entry
+        return entry
+
+
+async def cache_pricing(cache_key: Tuple, response: Dict[str, Any]) -> None:
+    """Store a get_products response in the cache.
+
+    Only the fields needed to reproduce the response ('PriceList' and
+    'NextToken') are retained.
+
+    Args:
+        cache_key: Key built by build_pricing_cache_key()
+        response: The get_products response to cache
+    """
+    entry: Dict[str, Any] = {'PriceList': response['PriceList']}
+    if 'NextToken' in response:
+        entry['NextToken'] = response['NextToken']
+
+    async with _pricing_cache_lock:
+        _pricing_cache[cache_key] = entry
+    if _disk_cache is not None:
+        _disk_cache.set(cache_key, entry, expire=PRICING_DISK_CACHE_TTL_SECONDS)
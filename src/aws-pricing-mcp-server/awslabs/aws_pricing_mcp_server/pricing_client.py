@@ -25,6 +25,12 @@ from loguru import logger
 from typing import Any, Optional
 
 
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+
 # Set up logging
 logger.remove()
 logger.add(sys.stderr, level=consts.LOG_LEVEL)
@@ -80,6 +86,31 @@ def get_pricing_region(requested_region: Optional[str] = None) -> str:
     return pricing_region
 
 
+def _pricing_client_config(pricing_region: str) -> Config:
+    """Build the botocore Config shared by the sync and async pricing clients.
+
+    Per-call parameter validation is disabled because the only request shapes
+    sent by this server are assembled internally and validated by the API
+    anyway; skipping botocore's model-driven validation trims per-call CPU.
+    Keep-alive and a larger connection pool let concurrent batch queries reuse
+    TLS connections instead of re-handshaking.
+
+    Args:
+        pricing_region: The pricing API region the client will talk to
+
+    Returns:
+        botocore Config for a pricing client
+    """
+    return Config(
+        region_name=pricing_region,
+        user_agent_extra=f'awslabs/mcp/{consts.MCP_SERVER_NAME}/{__version__}',
+        retries={'mode': 'adaptive', 'max_attempts': 5},
+        parameter_validation=False,
+        tcp_keepalive=True,
+        max_pool_connections=50,
+    )
+
+
 def create_pricing_client(profile: Optional[str] = None, region: Optional[str] = None) -> Any:
     """Create an AWS Pricing API client.
 
@@ -96,10 +127,7 @@ def create_pricing_client(profile: Optional[str] = None, region: Optional[str] =
     # Determine the appropriate pricing region
     pricing_region = get_pricing_region(region)
 
-    config = Config(
-        region_name=pricing_region,
-        user_agent_extra=f'awslabs/mcp/{consts.MCP_SERVER_NAME}/{__version__}',
-    )
+    config = _pricing_client_config(pricing_region)
 
     logger.debug(
         f'Creating pricing client for region "{pricing_region}" and profile "{profile_name}"'
@@ -107,6 +135,81 @@ def create_pricing_client(profile: Optional[str] = None, region: Optional[str] =
     return session.client('pricing', config=config, endpoint_url=consts.PRICING_ENDPOINT)
 
 
+# Shared boto3 clients keyed by (profile, region). Creating a client loads
+# credentials and the service model from disk, which is far more expensive
+# than any single Pricing API call, so tools reuse one instance per
+# configuration. boto3 clients are thread-safe for the read-only calls made
+# by this server.
+_default_client_cache: dict = {}
+
+
+def get_default_pricing_client(profile: Optional[str] = None, region: Optional[str] = None) -> Any:
+    """Return a shared pricing client, creating it on first use.
+
+    Args:
+        profile: AWS profile name to use (default: None, uses AWS_PROFILE or default profile)
+        region: AWS region name (default: None, uses AWS_REGION env var or nearest pricing region)
+
+    Returns:
+        boto3 pricing client shared across requests for this configuration
+    """
+    key = (profile, region)
+    client = _default_client_cache.get(key)
+    if client is None:
+        client = create_pricing_client(profile=profile, region=region)
+        _default_client_cache[key] = client
+    return client
+
+
+def reset_default_pricing_clients() -> None:
+    """Discard all shared pricing clients (primarily for tests)."""
+    _default_client_cache.clear()
+
+
+def async_pricing_client_available() -> bool:
+    """Check whether the non-blocking aioboto3 pricing client can be used."""
+    return aioboto3 is not None
+
+
+def create_async_pricing_client(
+    profile: Optional[str] = None, region: Optional[str] = None
+) -> Any:
+    """Create an async AWS Pricing API client.
+
+    The returned object must be used as an async context manager; entering the
+    context creates the underlying aiobotocore client and leaving it closes it.
+    A fresh context is created per call on purpose - returning a client from
+    inside an `async with` block would hand out an already-closed client.
+
+    Args:
+        profile: AWS profile name to use (default: None, uses AWS_PROFILE or default profile)
+        region: AWS region name (default: None, uses AWS_REGION env var or nearest pricing region)
+
+    Returns:
+        aioboto3 pricing client context manager
+
+    Raises:
+        ImportError: If aioboto3 is not installed
+    """
+    if aioboto3 is None:
+        raise ImportError(
+            'aioboto3 is required for the async pricing client; falling back to boto3'
+        )
+
+    profile_name = profile if profile else consts.AWS_PROFILE
+    session = aioboto3.Session(profile_name=profile_name)
+
+    # Determine the appropriate pricing region
+    pricing_region = get_pricing_region(region)
+
+    config = _pricing_client_config(pricing_region)
+
+    logger.debug(
+        f'Creating async pricing client for region "{pricing_region}" and profile "{profile_name}"'
+    )
+    return session.client('pricing', config=config, endpoint_url=consts.PRICING_ENDPOINT)
+
+
 def get_currency_for_region(region: str) -> str:
     """Determine currency based on AWS region.
 
@@ -20,9 +20,31 @@ from .models import OutputOptions
 from typing import Any, Dict, List, Optional
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_json(json_str: str) -> Any:
+    """Parse a JSON string, using orjson when available for faster parsing.
+
+    PriceList records are parsed in bulk on every get_pricing call, so the
+    faster C parser pays off for large responses; stdlib json is the fallback
+    when orjson is not installed.
+
+    Raises:
+        ValueError: If the string is not valid JSON (orjson.JSONDecodeError
+            and json.JSONDecodeError are both ValueError subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
 def _is_free_product(pricing_item: Dict[str, Any]) -> bool:
     """Check if product has only $0.00 OnDemand pricing across all currencies.
 
@@ -55,6 +77,49 @@ def _is_free_product(pricing_item: Dict[str, Any]) -> bool:
     return True
 
 
+def convert_to_columnar(price_list: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Convert row-oriented pricing records into a columnar layout.
+
+    Repeated per-record field names dominate the serialized size of large
+    responses. The structure-of-arrays layout stores each field name once
+    with parallel value lists: product attributes (plus 'sku') become
+    columns and each record's terms dictionary is kept in a 'terms' column.
+    Records missing an attribute contribute None so columns stay aligned.
+
+    Args:
+        price_list: Parsed pricing records as returned by transform_pricing_data
+
+    Returns:
+        Dictionary mapping column names to equal-length value lists
+    """
+    if not price_list:
+        return {}
+
+    # Collect attribute names across all records, preserving first-seen order
+    attribute_names: List[str] = []
+    seen = set()
+    for item in price_list:
+        for name in item.get('product', {}).get('attributes', {}):
+            if name not in seen:
+                seen.add(name)
+                attribute_names.append(name)
+
+    columns: Dict[str, List[Any]] = {'sku': []}
+    for name in attribute_names:
+        columns[name] = []
+    columns['terms'] = []
+
+    for item in price_list:
+        product = item.get('product', {})
+        attributes = product.get('attributes', {})
+        columns['sku'].append(product.get('sku'))
+        for name in attribute_names:
+            columns[name].append(attributes.get(name))
+        columns['terms'].append(item.get('terms'))
+
+    return columns
+
+
 def transform_pricing_data(
     pricing_json_list: List[str], output_options: Optional[OutputOptions]
 ) -> List[Dict[str, Any]]:
@@ -77,11 +142,11 @@ def transform_pricing_data(
     parsed_data = []
     for i, json_str in enumerate(pricing_json_list):
         try:
-            parsed_item = json.loads(json_str)
+            parsed_item = _parse_json(json_str)
             # Remove redundant serviceCode field (optimization)
             parsed_item.pop('serviceCode', None)
             parsed_data.append(parsed_item)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise ValueError(f'Invalid JSON format in pricing data at index {i}: {e}')
 
     # Return early if no filtering is needed
@@ -17,42 +17,146 @@
 This server provides tools for analyzing AWS service costs across different user tiers.
 """
 
+import asyncio
+import functools
+import inspect
+import itertools
 import sys
+import time
+import weakref
+from aiolimiter import AsyncLimiter
 from awslabs.aws_pricing_mcp_server import consts
-from awslabs.aws_pricing_mcp_server.cdk_analyzer import analyze_cdk_project
 from awslabs.aws_pricing_mcp_server.models import (
     ATTRIBUTE_NAMES_FIELD,
+    AXES_FIELD,
     EFFECTIVE_DATE_FIELD,
     FILTERS_FIELD,
     GET_PRICING_MAX_ALLOWED_CHARACTERS_FIELD,
+    MAX_CONCURRENCY_FIELD,
+    MAX_PAGES_FIELD,
     MAX_RESULTS_FIELD,
     NEXT_TOKEN_FIELD,
     OUTPUT_OPTIONS_FIELD,
+    QUERIES_FIELD,
     REGION_FIELD,
     SERVICE_CODE_FIELD,
     ErrorResponse,
     OutputOptions,
     PricingFilter,
+    PricingQuery,
+)
+from awslabs.aws_pricing_mcp_server.pricing_cache import (
+    build_pricing_cache_key,
+    cache_pricing,
+    get_cached_pricing,
 )
 from awslabs.aws_pricing_mcp_server.pricing_client import (
-    create_pricing_client,
+    async_pricing_client_available,
+    create_async_pricing_client,
     get_currency_for_region,
+    get_default_pricing_client,
+)
+from awslabs.aws_pricing_mcp_server.pricing_transformer import (
+    convert_to_columnar,
+    transform_pricing_data,
 )
-from awslabs.aws_pricing_mcp_server.pricing_transformer import transform_pricing_data
-from awslabs.aws_pricing_mcp_server.static.patterns import BEDROCK
-from awslabs.aws_pricing_mcp_server.terraform_analyzer import analyze_terraform_project
 from datetime import datetime, timezone
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 from pydantic.fields import FieldInfo
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 # Set up logging
 logger.remove()
 logger.add(sys.stderr, level=consts.LOG_LEVEL)
 
+# The AWS Price List API uses a token bucket of 10 with a refill rate of
+# 5 requests/second. Smoothing bursts client-side avoids ThrottlingException
+# and the botocore backoff retries that would otherwise dominate latency
+# during concurrent sweeps. AsyncLimiter instances must not be shared across
+# event loops, so one is kept per loop (the server runs a single loop).
+_pricing_limiters: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncLimiter]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _unwrap_field_defaults(fn):
+    """Resolve pydantic Field defaults for direct (non-MCP) calls.
+
+    Tool signatures use Field constants as Python defaults so FastMCP can
+    derive parameter schemas from them, but a direct call (tests, tools
+    delegating to other tools) would then receive the FieldInfo objects
+    themselves. The substitution table is computed once at decoration time,
+    replacing the per-parameter isinstance checks previously repeated inside
+    every tool body.
+    """
+    signature = inspect.signature(fn)
+    defaults = {
+        name: parameter.default.default
+        for name, parameter in signature.parameters.items()
+        if isinstance(parameter.default, FieldInfo) and not parameter.default.is_required()
+    }
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        for name, default in defaults.items():
+            if isinstance(bound.arguments.get(name), FieldInfo):
+                bound.arguments[name] = default
+        return await fn(*bound.args, **bound.kwargs)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=64)
+def _region_filter(region: Union[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """Build the Price List API region filter for a region or tuple of regions.
+
+    Batched and repeated queries rebuild the same filter for a small set of
+    regions, so the dict is cached; callers must treat it as read-only.
+    """
+    if isinstance(region, tuple):
+        return {'Field': 'regionCode', 'Type': 'ANY_OF', 'Value': ','.join(region)}
+    return {'Field': 'regionCode', 'Type': 'TERM_MATCH', 'Value': region}
+
+
+def _get_pricing_limiter() -> AsyncLimiter:
+    """Return the shared Pricing API rate limiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    limiter = _pricing_limiters.get(loop)
+    if limiter is None:
+        limiter = AsyncLimiter(max_rate=5, time_period=1)
+        _pricing_limiters[loop] = limiter
+    return limiter
+
+
+# Identical errors arrive in bursts when batched queries all fail the same
+# way (throttling, empty matrix sweeps). Duplicate messages within this
+# window are demoted to debug so the logger does not dominate the error
+# path; the MCP context is always notified so every caller sees its error.
+_ERROR_LOG_DEDUP_WINDOW_SECONDS = 5.0
+_recent_error_logs: Dict[Tuple[str, str], float] = {}
+
+
+def _should_log_error(error_type: str, message: str) -> bool:
+    """Check whether this error was already logged within the dedup window."""
+    now = time.monotonic()
+    key = (error_type, message[:200])
+    last_logged = _recent_error_logs.get(key)
+    if last_logged is not None and now - last_logged < _ERROR_LOG_DEDUP_WINDOW_SECONDS:
+        # Suppressed duplicates must not refresh the window, or a sustained
+        # storm would be logged exactly once instead of once per window
+        return False
+    _recent_error_logs[key] = now
+    if len(_recent_error_logs) > 256:
+        cutoff = now - _ERROR_LOG_DEDUP_WINDOW_SECONDS
+        for stale_key in [k for k, ts in _recent_error_logs.items() if ts < cutoff]:
+            del _recent_error_logs[stale_key]
+    return True
+
 
 async def create_error_response(
     ctx: Context,
@@ -61,16 +165,19 @@ async def create_error_response(
     **kwargs,  # Accept any additional fields dynamically
 ) -> Dict[str, Any]:
     """Create a standardized error response, log it, and notify context."""
-    logger.error(message)
+    if _should_log_error(error_type, message):
+        logger.error(message)
+    else:
+        logger.debug(f'Duplicate error (suppressed from error log): {message}')
     await ctx.error(message)
 
     error_response = ErrorResponse(
         error_type=error_type,
         message=message,
-        **kwargs,
+        extra=kwargs,
     )
 
-    return error_response.model_dump()
+    return error_response.to_dict()
 
 
 mcp = FastMCP(
@@ -167,13 +274,21 @@ async def analyze_cdk_project_wrapper(
     Returns:
         Dictionary containing the identified services and their configurations
     """
+    # Imported lazily so the CDK analyzer stack only loads when a project is
+    # actually analyzed, keeping server cold start fast
+    from awslabs.aws_pricing_mcp_server.cdk_analyzer import analyze_cdk_project
+
     try:
         analysis_result = await analyze_cdk_project(project_path)
-        logger.info(f'Analysis result: {analysis_result}')
+        # Lazy formatting: stringifying a large services dict is skipped
+        # entirely when INFO is not enabled
+        logger.opt(lazy=True).info('Analysis result: {}', lambda: analysis_result)
         if analysis_result and 'services' in analysis_result:
             return analysis_result
         else:
-            logger.error(f'Invalid analysis result format: {analysis_result}')
+            logger.opt(lazy=True).error(
+                'Invalid analysis result format: {}', lambda: analysis_result
+            )
             return {
                 'status': 'error',
                 'services': [],
@@ -202,13 +317,21 @@ async def analyze_terraform_project_wrapper(
     Returns:
         Dictionary containing the identified services and their configurations
     """
+    # Imported lazily so the Terraform analyzer stack only loads when a
+    # project is actually analyzed, keeping server cold start fast
+    from awslabs.aws_pricing_mcp_server.terraform_analyzer import analyze_terraform_project
+
     try:
         analysis_result = await analyze_terraform_project(project_path)
-        logger.info(f'Analysis result: {analysis_result}')
+        # Lazy formatting: stringifying a large services dict is skipped
+        # entirely when INFO is not enabled
+        logger.opt(lazy=True).info('Analysis result: {}', lambda: analysis_result)
         if analysis_result and 'services' in analysis_result:
             return analysis_result
         else:
-            logger.error(f'Invalid analysis result format: {analysis_result}')
+            logger.opt(lazy=True).error(
+                'Invalid analysis result format: {}', lambda: analysis_result
+            )
             return {
                 'status': 'error',
                 'services': [],
@@ -233,6 +356,7 @@ async def analyze_terraform_project_wrapper(
     - output_options (optional): OutputOptions object for response transformation and size reduction
     - max_results (optional): Maximum number of results to return per page (default: 100, min: 1, max: 100)
     - next_token (optional): Pagination token from previous response to get next page of results
+    - max_pages (optional): Number of result pages to fetch and concatenate automatically (default: 1). Use for exhaustive queries instead of re-issuing calls with next_token; fetching stops early if the character limit is reached
 
     **MANDATORY WORKFLOW - ALWAYS FOLLOW:**
 
@@ -290,6 +414,7 @@ async def analyze_terraform_project_wrapper(
     - **ATTRIBUTE DISCOVERY**: Use get_pricing_service_attributes() - same names for filters and output_options
     - **SIZE REDUCTION**: 80%+ reduction with combined pricing_terms + product_attributes
     - **exclude_free_products**: Remove products with $0.00 OnDemand pricing (useful when you know service has paid tiers)
+    - **columnar**: Return one list per field instead of one dictionary per record - field names are serialized once, shrinking large result sets further
     - **WHEN TO USE**: Always for large services, recommended for all services to improve performance
 
     **CRITICAL REQUIREMENTS:**
@@ -369,6 +494,7 @@ async def analyze_terraform_project_wrapper(
     - For cost optimization: tested ALL qualifying tiers exhaustively (in a reasonable range)
     """,
 )
+@_unwrap_field_defaults
 async def get_pricing(
     ctx: Context,
     service_code: str = SERVICE_CODE_FIELD,
@@ -378,6 +504,7 @@ async def get_pricing(
     output_options: Optional[OutputOptions] = OUTPUT_OPTIONS_FIELD,
     max_results: int = MAX_RESULTS_FIELD,
     next_token: Optional[str] = NEXT_TOKEN_FIELD,
+    max_pages: int = MAX_PAGES_FIELD,
 ) -> Dict[str, Any]:
     """Get pricing information from AWS Price List API.
 
@@ -389,65 +516,126 @@ async def get_pricing(
         output_options: Optional output filtering options to reduce response size
         max_results: Maximum number of results to return per page (default: 100, max: 100)
         next_token: Pagination token from previous response to get next page of results
+        max_pages: Number of result pages to fetch and concatenate automatically (default: 1)
         ctx: MCP context for logging and state management
 
     Returns:
         Dictionary containing pricing information from AWS Pricing API. If more results are available,
         the response will include a 'next_token' field that can be used for subsequent requests.
     """
-    # Handle Pydantic Field objects when called directly (not through MCP framework)
-    if isinstance(filters, FieldInfo):
-        filters = filters.default
-    if isinstance(max_allowed_characters, FieldInfo):
-        max_allowed_characters = max_allowed_characters.default
-    if isinstance(output_options, FieldInfo):
-        output_options = output_options.default
-    if isinstance(max_results, FieldInfo):
-        max_results = max_results.default
-    if isinstance(next_token, FieldInfo):
-        next_token = next_token.default
-
     logger.info(f'Getting pricing for {service_code} in {region}')
 
-    # Create pricing client with error handling
-    try:
-        pricing_client = create_pricing_client()
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='client_creation_failed',
-            message=f'Failed to create AWS Pricing client: {str(e)}',
-            service_code=service_code,
-            region=region,
-        )
+    # Prefer the non-blocking aioboto3 client so concurrent tool calls overlap
+    # on the network instead of stalling the event loop; fall back to boto3 if
+    # aioboto3 is missing. The async client context is not created here but on
+    # the first cache miss: creating it eagerly would leave its client-creation
+    # coroutine un-awaited (and warning) whenever the cache serves every page.
+    use_async_client = async_pricing_client_available()
+    pricing_client = None
+    if not use_async_client:
+        try:
+            pricing_client = get_default_pricing_client()
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='client_creation_failed',
+                message=f'Failed to create AWS Pricing client: {str(e)}',
+                service_code=service_code,
+                region=region,
+            )
 
     # Build filters
     try:
-        # Build region filter based on parameter type
-        api_filters = [
-            {
-                'Field': 'regionCode',
-                'Type': 'ANY_OF' if isinstance(region, list) else 'TERM_MATCH',
-                'Value': ','.join(region) if isinstance(region, list) else region,
-            }
-        ]
+        # Build region filter based on parameter type (cached per region)
+        api_filters = [_region_filter(tuple(region) if isinstance(region, list) else region)]
 
-        # Add any additional filters if provided
+        # Add any additional filters if provided. The region parameter already
+        # produces the regionCode filter, so a user-supplied duplicate is
+        # dropped - otherwise logically identical queries would fragment into
+        # separate cache entries and ship a redundant filter to the API.
         if filters:
-            api_filters.extend([f.model_dump(by_alias=True) for f in filters])
+            user_filters = [f.model_dump(by_alias=True) for f in filters]
+            api_filters.extend(f for f in user_filters if f['Field'] != 'regionCode')
+
+        # Fetch up to max_pages result pages, following NextToken so
+        # exhaustive queries are not silently truncated at one page. Each
+        # page is transformed as it arrives so its raw JSON strings can be
+        # released immediately; peak memory holds one raw page plus the
+        # parsed records instead of the full raw and parsed payloads twice.
+        price_list: List[Dict[str, Any]] = []
+        raw_item_count = 0
+        raw_characters = 0
+        page_token = next_token
+        pages_fetched = 0
 
-        # Make the API request
-        api_params = {
-            'ServiceCode': service_code,
-            'Filters': api_filters,
-            'MaxResults': max_results,
-        }
+        while True:
+            api_params = {
+                'ServiceCode': service_code,
+                'Filters': api_filters,
+                'MaxResults': max_results,
+            }
 
-        # Only include NextToken if it's provided
-        if next_token:
-            api_params['NextToken'] = next_token
+            # Only include NextToken if it's provided
+            if page_token:
+                api_params['NextToken'] = page_token
+
+            # Serve repeated identical queries (e.g. cost optimization matrix
+            # sweeps) from the in-process TTL cache instead of AWS
+            cache_key = build_pricing_cache_key(
+                service_code, region, api_filters, max_results, page_token
+            )
+            response = await get_cached_pricing(cache_key)
+            if response is None:
+                if use_async_client:
+                    try:
+                        client_context = create_async_pricing_client()
+                    except Exception as e:
+                        return await create_error_response(
+                            ctx=ctx,
+                            error_type='client_creation_failed',
+                            message=f'Failed to create AWS Pricing client: {str(e)}',
+                            service_code=service_code,
+                            region=region,
+                        )
+                # Cache misses go through the shared rate limiter so concurrent
+                # sweeps are smoothed instead of throttled and retried
+                async with _get_pricing_limiter():
+                    if use_async_client:
+                        # A fresh context per page: aiobotocore client contexts
+                        # are single-use and cannot be re-entered. Entering
+                        # creates the underlying client and leaving closes it.
+                        async with client_context as client:
+                            response = await client.get_products(**api_params)
+                    else:
+                        response = pricing_client.get_products(**api_params)
+                if response.get('PriceList'):
+                    await cache_pricing(cache_key, response)
+            else:
+                logger.debug(f'Pricing cache hit for {service_code} in {region}')
+
+            page_list = response.get('PriceList', [])
+            raw_item_count += len(page_list)
+            raw_characters += sum(len(item) for item in page_list)
+            try:
+                price_list.extend(transform_pricing_data(page_list, output_options))
+            except ValueError as e:
+                return await create_error_response(
+                    ctx=ctx,
+                    error_type='data_processing_error',
+                    message=f'Failed to process pricing data: {str(e)}',
+                    service_code=service_code,
+                    region=region,
+                )
+            pages_fetched += 1
+            page_token = response.get('NextToken')
+
+            if not page_token or pages_fetched >= max_pages:
+                break
 
-        response = pricing_client.get_products(**api_params)
+            # Stop early once the accumulated payload reaches the character
+            # budget; further pages would only be rejected as too large
+            if max_allowed_characters != -1 and raw_characters >= max_allowed_characters:
+                break
     except Exception as e:
         return await create_error_response(
             ctx=ctx,
@@ -459,7 +647,7 @@ async def get_pricing(
         )
 
     # Check if results are empty
-    if not response.get('PriceList'):
+    if not raw_item_count:
         return await create_error_response(
             ctx=ctx,
             error_type='empty_results',
@@ -479,18 +667,7 @@ async def get_pricing(
             },
         )
 
-    # Apply filtering with error handling
-    try:
-        price_list = transform_pricing_data(response['PriceList'], output_options)
-        total_count = len(price_list)
-    except ValueError as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='data_processing_error',
-            message=f'Failed to process pricing data: {str(e)}',
-            service_code=service_code,
-            region=region,
-        )
+    total_count = len(price_list)
 
     # Check if results exceed the character threshold (unless max_characters is -1 for unlimited)
     if max_allowed_characters != -1:
@@ -515,20 +692,232 @@ async def get_pricing(
     logger.info(f'Successfully retrieved {total_count} pricing items for {service_code}')
     await ctx.info(f'Successfully retrieved pricing for {service_code} in {region}')
 
+    # Convert to columnar layout last so size checks and error samples
+    # operate on the familiar row-oriented records
+    data: Any = price_list
+    if output_options is not None and output_options.columnar:
+        data = convert_to_columnar(price_list)
+
     result = {
         'status': 'success',
         'service_name': service_code,
-        'data': price_list,
+        'data': data,
         'message': f'Retrieved pricing for {service_code} in {region} from AWS Pricing API',
     }
 
-    # Include next_token if present for pagination
-    if 'NextToken' in response:
-        result['next_token'] = response['NextToken']
+    # Include next_token if more pages remain beyond the ones fetched
+    if page_token:
+        result['next_token'] = page_token
 
     return result
 
 
+@mcp.tool(
+    name='get_pricing_batch',
+    description="""Execute multiple pricing queries concurrently in a single call.
+
+    **PURPOSE:** Run matrix sweeps (multiple regions, memory tiers, instance families) without
+    issuing sequential get_pricing calls. Queries are fired concurrently, bounded by a semaphore,
+    so N queries overlap on the network instead of running one after another.
+
+    **PARAMETERS:**
+    - queries (required): List of query objects, each with:
+      * service_code: AWS service code (e.g., 'AmazonEC2')
+      * region: AWS region string or list for multi-region comparison
+      * filters (optional): Same filter format as get_pricing
+    - max_concurrency (optional): Concurrent query limit (default: 8, max: 32). The default
+      stays under AWS Pricing API throttling limits; raising it rarely helps.
+
+    **RETURNS:** List of responses aligned with the input queries - the Nth response corresponds
+    to the Nth query. Each response has the same structure as a get_pricing response, so
+    individual queries can fail (status 'error') without failing the whole batch.
+
+    **WHEN TO USE:**
+    - Multi-region price comparison where regions need separate result sets
+    - Cost optimization sweeps across mutually exclusive tiers (memory, storage)
+    - Any workflow that would otherwise loop over get_pricing sequentially
+
+    **WHEN NOT TO USE:**
+    - A single query can express the comparison with an ANY_OF filter (preferred - one API call)
+    - Only one (service_code, region, filters) combination is needed - use get_pricing
+
+    **EXAMPLE:**
+    ```python
+    queries = [
+        {'service_code': 'AmazonEC2', 'region': 'us-east-1',
+         'filters': [{'Field': 'instanceType', 'Value': 'm5.large', 'Type': 'EQUALS'}]},
+        {'service_code': 'AmazonEC2', 'region': 'eu-west-1',
+         'filters': [{'Field': 'instanceType', 'Value': 'm5.large', 'Type': 'EQUALS'}]},
+    ]
+    results = get_pricing_batch(queries)
+    ```
+    """,
+)
+@_unwrap_field_defaults
+async def get_pricing_batch(
+    ctx: Context,
+    queries: List[PricingQuery] = QUERIES_FIELD,
+    max_concurrency: int = MAX_CONCURRENCY_FIELD,
+    max_allowed_characters: int = GET_PRICING_MAX_ALLOWED_CHARACTERS_FIELD,
+    output_options: Optional[OutputOptions] = OUTPUT_OPTIONS_FIELD,
+) -> List[Dict[str, Any]]:
+    """Execute multiple pricing queries concurrently.
+
+    Args:
+        queries: List of pricing queries (service_code, region, optional filters)
+        max_concurrency: Maximum number of queries in flight at once (default: 8)
+        max_allowed_characters: Optional per-query character limit (default: 100,000, use -1 for unlimited)
+        output_options: Optional output filtering options applied to every query
+        ctx: MCP context for logging and state management
+
+    Returns:
+        List of get_pricing responses aligned with the input queries; failed
+        queries yield an error response at their position instead of failing
+        the whole batch.
+    """
+    if not queries:
+        return []
+
+    logger.info(f'Executing batch of {len(queries)} pricing queries (limit {max_concurrency})')
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_query(query: PricingQuery) -> Dict[str, Any]:
+        async with semaphore:
+            return await get_pricing(
+                ctx,
+                query.service_code,
+                query.region,
+                query.filters,
+                max_allowed_characters=max_allowed_characters,
+                output_options=output_options,
+            )
+
+    results = await asyncio.gather(*(run_query(q) for q in queries), return_exceptions=True)
+
+    responses: List[Dict[str, Any]] = []
+    for query, result in zip(queries, results):
+        if isinstance(result, BaseException):
+            responses.append(
+                await create_error_response(
+                    ctx=ctx,
+                    error_type='batch_query_failed',
+                    message=f'Pricing query for service "{query.service_code}" in region "{query.region}" failed: {result}',
+                    service_code=query.service_code,
+                    region=query.region,
+                )
+            )
+        else:
+            responses.append(result)
+
+    return responses
+
+
+@mcp.tool(
+    name='get_pricing_matrix',
+    description="""Expand attribute axes into a cross-product of pricing queries and run them concurrently.
+
+    **PURPOSE:** Cost optimization analyses ask for "ALL qualifying combinations" of attributes
+    (instance types x operating systems x tenancy, ...). Instead of looping over get_pricing
+    per combination, pass the candidate values per attribute and the server generates the
+    deduplicated Cartesian product, fires the queries concurrently, and serves repeats from
+    the pricing cache.
+
+    **PARAMETERS:**
+    - service_code (required): AWS service code (e.g., 'AmazonEC2')
+    - region (required): AWS region string or list for multi-region comparison
+    - axes (required): Mapping of attribute name to candidate values, e.g.
+      {'instanceType': ['t3.medium', 't3.large'], 'operatingSystem': ['Linux']}
+    - max_concurrency (optional): Concurrent query limit (default: 8, max: 32)
+
+    **RETURNS:** One entry per combination, each with:
+    - axes: The attribute values for this combination (e.g., {'instanceType': 't3.medium', ...})
+    - response: The get_pricing response for that combination (status 'success' or 'error')
+
+    **WHEN TO USE:**
+    - Sweeping a pricing matrix to find the cheapest qualifying configuration
+    - Any workflow that would loop get_pricing over itertools.product of attribute values
+
+    **WHEN NOT TO USE:**
+    - A single attribute varies - use one get_pricing call with an ANY_OF filter
+    - The combinations are not a full cross-product - use get_pricing_batch with explicit queries
+
+    **EXAMPLE:**
+    ```python
+    results = get_pricing_matrix(
+        'AmazonEC2', 'us-east-1',
+        axes={'instanceType': ['t3.medium', 't3.large'], 'operatingSystem': ['Linux', 'Windows']},
+    )  # 4 combinations, each with its own pricing response
+    ```
+    """,
+)
+@_unwrap_field_defaults
+async def get_pricing_matrix(
+    ctx: Context,
+    service_code: str = SERVICE_CODE_FIELD,
+    region: Union[str, List[str]] = REGION_FIELD,
+    axes: Dict[str, List[str]] = AXES_FIELD,
+    max_concurrency: int = MAX_CONCURRENCY_FIELD,
+    max_allowed_characters: int = GET_PRICING_MAX_ALLOWED_CHARACTERS_FIELD,
+    output_options: Optional[OutputOptions] = OUTPUT_OPTIONS_FIELD,
+) -> List[Dict[str, Any]]:
+    """Run pricing queries for every combination of the given attribute axes.
+
+    Args:
+        service_code: AWS service code applied to every combination
+        region: AWS region(s) applied to every combination
+        axes: Mapping of attribute name to candidate values; one query is
+            generated per element of the Cartesian product
+        max_concurrency: Maximum number of queries in flight at once (default: 8)
+        max_allowed_characters: Optional per-query character limit (default: 100,000, use -1 for unlimited)
+        output_options: Optional output filtering options applied to every query
+        ctx: MCP context for logging and state management
+
+    Returns:
+        List with one entry per combination, each carrying the combination's
+        attribute values under 'axes' and its get_pricing response under
+        'response'.
+    """
+    if not axes:
+        return []
+
+    # Deduplicate candidate values per axis while preserving order, so
+    # repeated values do not inflate the cross-product
+    axis_names = list(axes.keys())
+    axis_values = [list(dict.fromkeys(values)) for values in axes.values()]
+    combinations = list(itertools.product(*axis_values))
+
+    logger.info(
+        f'Expanding pricing matrix for {service_code}: '
+        f'{len(combinations)} combinations across {len(axis_names)} axes'
+    )
+
+    queries = [
+        PricingQuery(
+            service_code=service_code,
+            region=region,
+            filters=[
+                PricingFilter(Field=name, Value=value)
+                for name, value in zip(axis_names, combination)
+            ],
+        )
+        for combination in combinations
+    ]
+
+    responses = await get_pricing_batch(
+        ctx,
+        queries,
+        max_concurrency=max_concurrency,
+        max_allowed_characters=max_allowed_characters,
+        output_options=output_options,
+    )
+
+    return [
+        {'axes': dict(zip(axis_names, combination)), 'response': response}
+        for combination, response in zip(combinations, responses)
+    ]
+
+
 @mcp.tool(
     name='get_bedrock_patterns',
     description='Get architecture patterns for Amazon Bedrock applications, including component relationships and cost considerations',
@@ -543,6 +932,9 @@ async def get_bedrock_patterns(ctx: Optional[Context] = None) -> str:
     Returns:
         String containing the architecture patterns in markdown format
     """
+    # Imported lazily so the pattern file is only read once it is first needed
+    from awslabs.aws_pricing_mcp_server.static.patterns import BEDROCK
+
     return BEDROCK
 
 
@@ -750,15 +1142,14 @@ async def generate_cost_report_wrapper(
         services = f'{service_name}, {", ".join(related_services)}'
 
     # 2. Get architecture patterns if relevant (e.g., for Bedrock)
+    # BEDROCK is read from disk exactly once at static.patterns import
+    # (deferred to first use); reference the module constant directly instead
+    # of round-tripping through the get_bedrock_patterns tool for every report.
     architecture_patterns = {}
     if 'bedrock' in services.lower():
-        try:
-            # Get Bedrock architecture patterns
-            bedrock_patterns = await get_bedrock_patterns(ctx)
-            architecture_patterns['bedrock'] = bedrock_patterns
-        except Exception as e:
-            if ctx:
-                await ctx.warning(f'Could not get Bedrock patterns: {e}')
+        from awslabs.aws_pricing_mcp_server.static.patterns import BEDROCK
+
+        architecture_patterns['bedrock'] = BEDROCK
 
     # 3. Process recommendations
     try:
@@ -833,7 +1224,7 @@ async def get_pricing_service_codes(ctx: Context) -> Union[List[str], Dict[str,
 
     # Create pricing client with error handling
     try:
-        pricing_client = create_pricing_client()
+        pricing_client = get_default_pricing_client()
     except Exception as e:
         return await create_error_response(
             ctx=ctx,
@@ -920,7 +1311,7 @@ async def get_pricing_service_attributes(
 
     # Create pricing client with error handling
     try:
-        pricing_client = create_pricing_client()
+        pricing_client = get_default_pricing_client()
     except Exception as e:
         return await create_error_response(
             ctx=ctx,
@@ -1133,7 +1524,7 @@ async def get_pricing_attribute_values(
 
     # Create pricing client with error handling
     try:
-        pricing_client = create_pricing_client()
+        pricing_client = get_default_pricing_client()
     except Exception as e:
         return await create_error_response(
             ctx=ctx,
@@ -1206,6 +1597,7 @@ async def get_pricing_attribute_values(
     - Use `tail -n +7 pricing.csv | grep "t3.medium"` to filter data
     """,
 )
+@_unwrap_field_defaults
 async def get_price_list_urls(
     ctx: Context,
     service_code: str = SERVICE_CODE_FIELD,
@@ -1239,7 +1631,7 @@ async def get_price_list_urls(
 
     try:
         # Create pricing client
-        pricing_client = create_pricing_client()
+        pricing_client = get_default_pricing_client()
     except Exception as e:
         return await create_error_response(
             ctx=ctx,
@@ -17,11 +17,58 @@
 import json
 import pytest
 import tempfile
+from awslabs.aws_pricing_mcp_server import pricing_cache, pricing_client, server
 from pathlib import Path
 from typing import Any, Dict, Generator
 from unittest.mock import AsyncMock, MagicMock
 
 
+class _SingleUseClientContext:
+    """Mimic aiobotocore's ClientCreatorContext: enterable exactly once.
+
+    The real context stores the client-creation coroutine and awaits it on
+    entry, so re-entering raises. Reproducing that here ensures the server
+    creates a fresh context per request instead of reusing one.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._entered = False
+
+    async def __aenter__(self):
+        if self._entered:
+            raise RuntimeError('cannot reuse already awaited coroutine')
+        self._entered = True
+        return self._client
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def clear_pricing_cache():
+    """Ensure each test starts with an empty pricing response cache."""
+    pricing_cache._pricing_cache.clear()
+    yield
+    pricing_cache._pricing_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_pricing_clients():
+    """Ensure shared pricing clients created under one mock do not leak to the next test."""
+    pricing_client.reset_default_pricing_clients()
+    yield
+    pricing_client.reset_default_pricing_clients()
+
+
+@pytest.fixture(autouse=True)
+def reset_error_log_dedup():
+    """Ensure error log deduplication state does not leak between tests."""
+    server._recent_error_logs.clear()
+    yield
+    server._recent_error_logs.clear()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock MCP context."""
@@ -167,11 +214,11 @@ def temp_output_dir() -> Generator[str, None, None]:
 
 
 @pytest.fixture
-def mock_boto3() -> MagicMock:
-    """Mock boto3 for testing AWS API calls."""
+def mock_boto3(monkeypatch) -> MagicMock:
+    """Mock boto3 (and its aioboto3 counterpart) for testing AWS API calls."""
     mock = MagicMock()
 
-    # Mock pricing client
+    # Mock pricing client shared by the sync and async code paths
     pricing_client = MagicMock()
 
     # Create sample pricing data as a dictionary then convert to JSON string
@@ -198,18 +245,30 @@ def mock_boto3() -> MagicMock:
         },
     }
 
-    # Return JSON strings in PriceList (as the real AWS API does)
-    pricing_client.get_products.return_value = {
-        'PriceList': [
-            json.dumps(sample_pricing_item),
-        ],
-    }
+    # Return JSON strings in PriceList (as the real AWS API does);
+    # get_products is awaited through the async client, so it must be async
+    pricing_client.get_products = AsyncMock(
+        return_value={
+            'PriceList': [
+                json.dumps(sample_pricing_item),
+            ],
+        }
+    )
 
     # Mock session
     session = MagicMock()
     session.client.return_value = pricing_client
     mock.Session.return_value = session
 
+    # Route the aioboto3 session used by get_pricing to the same client, but
+    # hand out a fresh single-use context per client() call like the real
+    # library does
+    async_session = MagicMock()
+    async_session.client.side_effect = lambda *args, **kwargs: _SingleUseClientContext(
+        pricing_client
+    )
+    monkeypatch.setattr('aioboto3.Session', MagicMock(return_value=async_session))
+
     return mock
 
 
@@ -0,0 +1,208 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the pricing cache module of the aws-pricing-mcp-server."""
+
+import pytest
+from awslabs.aws_pricing_mcp_server import pricing_cache
+from awslabs.aws_pricing_mcp_server.models import PricingFilter
+from awslabs.aws_pricing_mcp_server.pricing_cache import (
+    build_pricing_cache_key,
+    cache_pricing,
+    get_cached_pricing,
+)
+from awslabs.aws_pricing_mcp_server.server import get_pricing
+from unittest.mock import patch
+
+
+class TestBuildPricingCacheKey:
+    """Tests for the build_pricing_cache_key function."""
+
+    def test_key_is_order_insensitive_for_filters(self):
+        """Test that filter ordering does not affect the cache key."""
+        filters_a = [
+            {'Field': 'instanceType', 'Type': 'TERM_MATCH', 'Value': 't3.medium'},
+            {'Field': 'regionCode', 'Type': 'TERM_MATCH', 'Value': 'us-east-1'},
+        ]
+        filters_b = list(reversed(filters_a))
+
+        key_a = build_pricing_cache_key('AmazonEC2', 'us-east-1', filters_a, 100, None)
+        key_b = build_pricing_cache_key('AmazonEC2', 'us-east-1', filters_b, 100, None)
+
+        assert key_a == key_b
+
+    def test_key_differs_by_service_region_and_pagination(self):
+        """Test that distinct queries produce distinct cache keys."""
+        filters = [{'Field': 'regionCode', 'Type': 'TERM_MATCH', 'Value': 'us-east-1'}]
+
+        base = build_pricing_cache_key('AmazonEC2', 'us-east-1', filters, 100, None)
+
+        assert base != build_pricing_cache_key('AmazonS3', 'us-east-1', filters, 100, None)
+        assert base != build_pricing_cache_key('AmazonEC2', 'us-west-2', filters, 100, None)
+        assert base != build_pricing_cache_key('AmazonEC2', 'us-east-1', filters, 50, None)
+        assert base != build_pricing_cache_key('AmazonEC2', 'us-east-1', filters, 100, 'token')
+
+    def test_key_handles_multi_region_list(self):
+        """Test that multi-region queries produce hashable, stable keys."""
+        filters = [
+            {'Field': 'regionCode', 'Type': 'ANY_OF', 'Value': 'us-east-1,us-west-2'},
+        ]
+        key = build_pricing_cache_key('AmazonEC2', ['us-east-1', 'us-west-2'], filters, 100, None)
+
+        assert hash(key) is not None
+        assert key == build_pricing_cache_key(
+            'AmazonEC2', ['us-east-1', 'us-west-2'], filters, 100, None
+        )
+
+
+class TestPricingCacheStorage:
+    """Tests for cache_pricing and get_cached_pricing."""
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self):
+        """Test that an unknown key returns None."""
+        key = build_pricing_cache_key('AmazonEC2', 'us-east-1', [], 100, None)
+        assert await get_cached_pricing(key) is None
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_preserves_price_list_and_token(self):
+        """Test that cached responses retain PriceList and NextToken."""
+        key = build_pricing_cache_key('AmazonEC2', 'us-east-1', [], 100, None)
+        await cache_pricing(key, {'PriceList': ['{"sku":"ABC123"}'], 'NextToken': 'token-1'})
+
+        cached = await get_cached_pricing(key)
+        assert cached == {'PriceList': ['{"sku":"ABC123"}'], 'NextToken': 'token-1'}
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_without_next_token(self):
+        """Test that NextToken is omitted from cache entries when absent."""
+        key = build_pricing_cache_key('AmazonEC2', 'us-east-1', [], 100, None)
+        await cache_pricing(key, {'PriceList': ['{"sku":"ABC123"}']})
+
+        cached = await get_cached_pricing(key)
+        assert cached == {'PriceList': ['{"sku":"ABC123"}']}
+
+
+class TestGetPricingCaching:
+    """Tests for TTL caching behavior in the get_pricing tool."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(self, mock_boto3, mock_context):
+        """Test that an identical repeated query does not hit the API again."""
+        pricing_client = mock_boto3.Session().client('pricing')
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            first = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+            second = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+
+        assert first['status'] == 'success'
+        assert second['status'] == 'success'
+        assert second['data'] == first['data']
+        pricing_client.get_products.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_call_does_not_create_async_client(self, mock_boto3, mock_context):
+        """Test that a fully cached call never constructs an async client."""
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            first = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+            with patch(
+                'awslabs.aws_pricing_mcp_server.server.create_async_pricing_client'
+            ) as mock_create:
+                second = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+
+        assert first['status'] == 'success'
+        assert second['status'] == 'success'
+        mock_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redundant_region_filter_shares_cache_entry(self, mock_boto3, mock_context):
+        """Test that a redundant regionCode filter maps to the same cache entry."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        redundant = [PricingFilter(Field='regionCode', Value='us-west-2')]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            first = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+            second = await get_pricing(mock_context, 'AWSLambda', 'us-west-2', redundant)
+
+        assert first['status'] == 'success'
+        assert second['status'] == 'success'
+        pricing_client.get_products.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_different_queries_are_not_conflated(self, mock_boto3, mock_context):
+        """Test that different queries each reach the API."""
+        pricing_client = mock_boto3.Session().client('pricing')
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+            await get_pricing(mock_context, 'AWSLambda', 'us-east-1')
+
+        assert pricing_client.get_products.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(self, mock_boto3, mock_context):
+        """Test that empty responses are retried instead of cached."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.return_value = {'PriceList': []}
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            first = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+            second = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
+
+        assert first['status'] == 'error'
+        assert second['status'] == 'error'
+        assert pricing_client.get_products.call_count == 2
+
+
+class TestPricingDiskCache:
+    """Tests for the optional on-disk pricing cache layer."""
+
+    @pytest.fixture
+    def disk_cache(self, tmp_path, monkeypatch):
+        """Enable a diskcache-backed second level in a temporary directory."""
+        diskcache = pytest.importorskip('diskcache')
+        cache = diskcache.Cache(str(tmp_path / 'pricing'))
+        monkeypatch.setattr(pricing_cache, '_disk_cache', cache)
+        yield cache
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_memory_cache_loss(self, disk_cache):
+        """Test that a cleared memory cache is repopulated from disk."""
+        key = build_pricing_cache_key('AmazonEC2', 'us-east-1', [], 100, None)
+        await cache_pricing(key, {'PriceList': ['{"sku":"ABC123"}']})
+
+        # Simulate a server restart: in-memory cache is gone, disk persists
+        pricing_cache._pricing_cache.clear()
+
+        entry = await get_cached_pricing(key)
+        assert entry == {'PriceList': ['{"sku":"ABC123"}']}
+
+    @pytest.mark.asyncio
+    async def test_disk_hits_are_promoted_to_memory(self, disk_cache):
+        """Test that a disk hit repopulates the in-memory cache."""
+        key = build_pricing_cache_key('AmazonEC2', 'us-east-1', [], 100, None)
+        await cache_pricing(key, {'PriceList': ['{"sku":"ABC123"}']})
+        pricing_cache._pricing_cache.clear()
+
+        await get_cached_pricing(key)
+
+        assert key in pricing_cache._pricing_cache
+
+    @pytest.mark.asyncio
+    async def test_memory_miss_without_disk_cache(self):
+        """Test that lookups still miss cleanly when no disk cache is configured."""
+        key = build_pricing_cache_key('AmazonEC2', 'us-east-1', [], 100, None)
+
+        assert await get_cached_pricing(key) is None
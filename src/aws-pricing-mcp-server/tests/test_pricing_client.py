@@ -16,6 +16,8 @@
 
 import pytest
 from awslabs.aws_pricing_mcp_server.pricing_client import (
+    async_pricing_client_available,
+    create_async_pricing_client,
     create_pricing_client,
     get_currency_for_region,
     get_pricing_region,
@@ -110,6 +112,32 @@ class TestCreatePricingClient:
 
         assert result == mock_client
 
+    @patch('awslabs.aws_pricing_mcp_server.pricing_client.boto3.Session')
+    def test_client_uses_adaptive_retries(self, mock_session):
+        """Test that the client config enables adaptive retry mode."""
+        mock_session_instance = Mock()
+        mock_session.return_value = mock_session_instance
+        mock_session_instance.client.return_value = Mock()
+
+        create_pricing_client()
+
+        config = mock_session_instance.client.call_args[1]['config']
+        assert config.retries == {'mode': 'adaptive', 'max_attempts': 5}
+
+    @patch('awslabs.aws_pricing_mcp_server.pricing_client.boto3.Session')
+    def test_client_config_trims_per_call_overhead(self, mock_session):
+        """Test that the client config disables validation and reuses connections."""
+        mock_session_instance = Mock()
+        mock_session.return_value = mock_session_instance
+        mock_session_instance.client.return_value = Mock()
+
+        create_pricing_client()
+
+        config = mock_session_instance.client.call_args[1]['config']
+        assert config.parameter_validation is False
+        assert config.tcp_keepalive is True
+        assert config.max_pool_connections == 50
+
     @patch('awslabs.aws_pricing_mcp_server.pricing_client.boto3.Session')
     def test_uses_env_profile_when_none_specified(self, mock_session, monkeypatch):
         """Test that AWS_PROFILE environment variable is used when no profile specified."""
@@ -167,6 +195,46 @@ class TestCreatePricingClient:
         assert result == mock_client
 
 
+class TestCreateAsyncPricingClient:
+    """Tests for the create_async_pricing_client function."""
+
+    @patch('awslabs.aws_pricing_mcp_server.pricing_client.aioboto3')
+    def test_create_async_client_parameters(self, mock_aioboto3):
+        """Test creating the async pricing client with profile and region mapping."""
+        mock_session_instance = Mock()
+        mock_client = Mock()
+        mock_aioboto3.Session.return_value = mock_session_instance
+        mock_session_instance.client.return_value = mock_client
+
+        result = create_async_pricing_client(profile='test-profile', region='eu-west-1')
+
+        # Verify session creation
+        mock_aioboto3.Session.assert_called_once_with(profile_name='test-profile')
+
+        # Verify client creation
+        mock_session_instance.client.assert_called_once()
+        call_args = mock_session_instance.client.call_args
+        assert call_args[0][0] == 'pricing'
+
+        # Verify config
+        config = call_args[1]['config']
+        assert config.region_name == 'eu-central-1'
+        assert 'awslabs/mcp/' in config.user_agent_extra
+
+        assert result == mock_client
+
+    @patch('awslabs.aws_pricing_mcp_server.pricing_client.aioboto3', None)
+    def test_raises_import_error_without_aioboto3(self):
+        """Test that ImportError is raised when aioboto3 is not installed."""
+        assert not async_pricing_client_available()
+        with pytest.raises(ImportError):
+            create_async_pricing_client()
+
+    def test_async_client_available(self):
+        """Test availability check when aioboto3 is importable."""
+        assert async_pricing_client_available()
+
+
 class TestGetCurrencyForRegion:
     """Tests for the get_currency_for_region function."""
 
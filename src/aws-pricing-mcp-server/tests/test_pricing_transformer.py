@@ -19,8 +19,10 @@ import pytest
 from awslabs.aws_pricing_mcp_server.models import OutputOptions
 from awslabs.aws_pricing_mcp_server.pricing_transformer import (
     _is_free_product,
+    convert_to_columnar,
     transform_pricing_data,
 )
+from unittest.mock import patch
 
 
 class TestOutputOptionsFiltering:
@@ -240,6 +242,17 @@ class TestOutputOptionsFiltering:
         with pytest.raises(ValueError, match='Invalid JSON format in pricing data at index 0'):
             transform_pricing_data(sample_data, output_options)
 
+    def test_transform_pricing_data_stdlib_json_fallback(self):
+        """Test that parsing works (and still validates) without orjson installed."""
+        sample_data = [json.dumps({'serviceCode': 'AmazonEC2', 'product': {'sku': 'ABC123'}})]
+
+        with patch('awslabs.aws_pricing_mcp_server.pricing_transformer.orjson', None):
+            result = transform_pricing_data(sample_data, None)
+            assert result == [{'product': {'sku': 'ABC123'}}]
+
+            with pytest.raises(ValueError, match='Invalid JSON format in pricing data at index 0'):
+                transform_pricing_data(['invalid json string'], None)
+
     def test_transform_pricing_data_size_reduction(self):
         """Test that filtering actually reduces response size."""
         sample_data = [
@@ -792,3 +805,53 @@ class TestExcludeFreeProductsFiltering:
     def test_is_free_product_helper_function(self, item, expected):
         """Test the _is_free_product helper function with various inputs."""
         assert _is_free_product(item) is expected
+
+
+class TestConvertToColumnar:
+    """Tests for the convert_to_columnar function."""
+
+    def test_converts_records_to_parallel_columns(self):
+        """Test that records become equal-length per-field lists."""
+        price_list = [
+            {
+                'product': {
+                    'sku': 'SKU1',
+                    'attributes': {'instanceType': 't3.medium', 'memory': '4 GiB'},
+                },
+                'terms': {'OnDemand': {'price': '0.0416'}},
+            },
+            {
+                'product': {
+                    'sku': 'SKU2',
+                    'attributes': {'instanceType': 'm5.large', 'memory': '8 GiB'},
+                },
+                'terms': {'OnDemand': {'price': '0.096'}},
+            },
+        ]
+
+        columns = convert_to_columnar(price_list)
+
+        assert columns['sku'] == ['SKU1', 'SKU2']
+        assert columns['instanceType'] == ['t3.medium', 'm5.large']
+        assert columns['memory'] == ['4 GiB', '8 GiB']
+        assert columns['terms'] == [
+            {'OnDemand': {'price': '0.0416'}},
+            {'OnDemand': {'price': '0.096'}},
+        ]
+
+    def test_missing_attributes_padded_with_none(self):
+        """Test that records missing an attribute keep columns aligned."""
+        price_list = [
+            {'product': {'sku': 'SKU1', 'attributes': {'instanceType': 't3.medium'}}},
+            {'product': {'sku': 'SKU2', 'attributes': {'memory': '8 GiB'}}},
+        ]
+
+        columns = convert_to_columnar(price_list)
+
+        assert columns['instanceType'] == ['t3.medium', None]
+        assert columns['memory'] == [None, '8 GiB']
+        assert columns['terms'] == [None, None]
+
+    def test_empty_price_list(self):
+        """Test that an empty record list yields an empty column mapping."""
+        assert convert_to_columnar([]) == {}
@@ -15,17 +15,20 @@
 """Tests for the server module of the aws-pricing-mcp-server."""
 
 import pytest
-from awslabs.aws_pricing_mcp_server.models import PricingFilter
+from awslabs.aws_pricing_mcp_server.models import PricingFilter, PricingQuery
 from awslabs.aws_pricing_mcp_server.pricing_transformer import (
     _is_free_product,
 )
 from awslabs.aws_pricing_mcp_server.server import (
     analyze_cdk_project_wrapper,
+    create_error_response,
     generate_cost_report_wrapper,
     get_bedrock_patterns,
     get_price_list_urls,
     get_pricing,
     get_pricing_attribute_values,
+    get_pricing_batch,
+    get_pricing_matrix,
     get_pricing_service_attributes,
     get_pricing_service_codes,
 )
@@ -204,6 +207,39 @@ class TestGetPricing:
         assert serialized['Value'] == 'm5'  # Should remain a string
         assert serialized['Type'] == 'CONTAINS'
 
+    @pytest.mark.asyncio
+    async def test_redundant_region_filter_dropped(self, mock_boto3, mock_context):
+        """Test that a user-supplied regionCode filter does not duplicate the region parameter."""
+        filters = [
+            PricingFilter(Field='regionCode', Value='us-east-1'),
+            PricingFilter(Field='instanceType', Value='t3.medium'),
+        ]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing(mock_context, 'AmazonEC2', 'us-east-1', filters)
+
+        assert result['status'] == 'success'
+
+        pricing_client = mock_boto3.Session().client('pricing')
+        call_args = pricing_client.get_products.call_args[1]
+        region_filters = [f for f in call_args['Filters'] if f['Field'] == 'regionCode']
+        assert len(region_filters) == 1
+        assert region_filters[0]['Value'] == 'us-east-1'
+
+    def test_filter_serialization_is_cached(self):
+        """Test that repeated default dumps reuse the pre-materialized dict."""
+        pricing_filter = PricingFilter(Field='instanceType', Value=['t3.medium'], Type='ANY_OF')
+
+        first = pricing_filter.model_dump(by_alias=True)
+        second = pricing_filter.model_dump()
+
+        assert first is second
+        assert first == {'Field': 'instanceType', 'Type': 'ANY_OF', 'Value': 't3.medium'}
+
+        # Non-default dumps bypass the cache and keep the raw value list
+        unaliased = pricing_filter.model_dump(by_alias=False)
+        assert unaliased['value'] == ['t3.medium']
+
     @pytest.mark.asyncio
     async def test_multi_region_pricing(self, mock_boto3, mock_context):
         """Test getting pricing for multiple regions using ANY_OF filter."""
@@ -362,9 +398,15 @@ class TestGetPricing:
     @pytest.mark.asyncio
     async def test_get_pricing_client_creation_error(self, mock_context):
         """Test handling of client creation errors."""
-        with patch(
-            'awslabs.aws_pricing_mcp_server.server.create_pricing_client',
-            side_effect=Exception('Client creation failed'),
+        with (
+            patch(
+                'awslabs.aws_pricing_mcp_server.server.create_async_pricing_client',
+                side_effect=Exception('Client creation failed'),
+            ),
+            patch(
+                'awslabs.aws_pricing_mcp_server.server.get_default_pricing_client',
+                side_effect=Exception('Client creation failed'),
+            ),
         ):
             result = await get_pricing(mock_context, 'AWSLambda', 'us-west-2')
 
@@ -535,6 +577,282 @@ class TestGetPricing:
             assert 'next_token' not in result
 
 
+class TestGetPricingMultiPage:
+    """Tests for automatic multi-page fetching in get_pricing."""
+
+    @pytest.mark.asyncio
+    async def test_max_pages_concatenates_results(self, mock_boto3, mock_context):
+        """Test that max_pages > 1 follows NextToken and concatenates pages."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.side_effect = [
+            {'PriceList': ['{"sku":"ABC123"}'], 'NextToken': 'page2'},
+            {'PriceList': ['{"sku":"DEF456"}']},
+        ]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing(mock_context, 'AmazonEC2', 'us-east-1', max_pages=5)
+
+        assert result['status'] == 'success'
+        assert len(result['data']) == 2
+        assert 'next_token' not in result
+
+        assert pricing_client.get_products.call_count == 2
+        second_call_kwargs = pricing_client.get_products.call_args_list[1][1]
+        assert second_call_kwargs['NextToken'] == 'page2'
+
+    @pytest.mark.asyncio
+    async def test_max_pages_limit_preserves_next_token(self, mock_boto3, mock_context):
+        """Test that fetching stops at max_pages and surfaces the remaining token."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.side_effect = [
+            {'PriceList': ['{"sku":"ABC123"}'], 'NextToken': 'page2'},
+            {'PriceList': ['{"sku":"DEF456"}'], 'NextToken': 'page3'},
+        ]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing(mock_context, 'AmazonEC2', 'us-east-1', max_pages=2)
+
+        assert result['status'] == 'success'
+        assert len(result['data']) == 2
+        assert result['next_token'] == 'page3'
+        assert pricing_client.get_products.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_character_budget_stops_page_fetching(self, mock_boto3, mock_context):
+        """Test that page fetching stops early once the character budget is reached."""
+        large_record = '{"sku":"%s"}' % ('X' * 200)
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.get_products.return_value = {
+            'PriceList': [large_record],
+            'NextToken': 'more',
+        }
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing(
+                mock_context, 'AmazonEC2', 'us-east-1', max_pages=10, max_allowed_characters=100
+            )
+
+        # The first page already exceeds the budget, so only one call is made
+        # and the oversized result is rejected as usual
+        assert result['status'] == 'error'
+        assert result['error_type'] == 'result_too_large'
+        pricing_client.get_products.assert_called_once()
+
+
+class TestGetPricingBatch:
+    """Tests for the get_pricing_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_batch_results_align_with_queries(self, mock_boto3, mock_context):
+        """Test that batch responses line up with the input queries."""
+        queries = [
+            PricingQuery(service_code='AWSLambda', region='us-east-1'),
+            PricingQuery(service_code='AmazonEC2', region='us-west-2'),
+            PricingQuery(service_code='AmazonS3', region='eu-west-1'),
+        ]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            results = await get_pricing_batch(mock_context, queries)
+
+        assert len(results) == 3
+        assert [r['service_name'] for r in results] == ['AWSLambda', 'AmazonEC2', 'AmazonS3']
+        assert all(r['status'] == 'success' for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_with_filters(self, mock_boto3, mock_context):
+        """Test that per-query filters are forwarded to the API."""
+        queries = [
+            PricingQuery(
+                service_code='AmazonEC2',
+                region='us-east-1',
+                filters=[PricingFilter(Field='instanceType', Value='t3.medium')],
+            ),
+        ]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            results = await get_pricing_batch(mock_context, queries)
+
+        assert results[0]['status'] == 'success'
+
+        pricing_client = mock_boto3.Session().client('pricing')
+        call_args = pricing_client.get_products.call_args[1]
+        filter_fields = [f['Field'] for f in call_args['Filters']]
+        assert 'instanceType' in filter_fields
+        assert 'regionCode' in filter_fields
+
+    @pytest.mark.asyncio
+    async def test_batch_partial_failure(self, mock_boto3, mock_context):
+        """Test that one failing query does not fail the whole batch."""
+        pricing_client = mock_boto3.Session().client('pricing')
+
+        async def mock_get_products(**kwargs):
+            filters = {f['Field']: f['Value'] for f in kwargs['Filters']}
+            if filters.get('regionCode') == 'us-west-2':
+                return {'PriceList': []}
+            return {'PriceList': ['{"sku":"ABC123"}']}
+
+        pricing_client.get_products.side_effect = mock_get_products
+
+        queries = [
+            PricingQuery(service_code='AWSLambda', region='us-east-1'),
+            PricingQuery(service_code='AWSLambda', region='us-west-2'),
+        ]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            results = await get_pricing_batch(mock_context, queries)
+
+        assert len(results) == 2
+        assert results[0]['status'] == 'success'
+        assert results[1]['status'] == 'error'
+        assert results[1]['error_type'] == 'empty_results'
+
+    @pytest.mark.asyncio
+    async def test_batch_empty_queries(self, mock_context):
+        """Test that an empty query list returns an empty result list."""
+        results = await get_pricing_batch(mock_context, [])
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_concurrency_limit(self, mock_boto3, mock_context):
+        """Test that no more than max_concurrency queries run at once."""
+        import asyncio
+
+        pricing_client = mock_boto3.Session().client('pricing')
+        in_flight = 0
+        max_in_flight = 0
+
+        async def mock_get_products(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {'PriceList': ['{"sku":"ABC123"}']}
+
+        pricing_client.get_products.side_effect = mock_get_products
+
+        # Distinct regions so the TTL cache does not coalesce the queries
+        queries = [PricingQuery(service_code='AWSLambda', region=f'us-east-{i}') for i in range(6)]
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            results = await get_pricing_batch(mock_context, queries, max_concurrency=2)
+
+        assert all(r['status'] == 'success' for r in results)
+        assert max_in_flight <= 2
+
+
+class TestGetPricingMatrix:
+    """Tests for the get_pricing_matrix function."""
+
+    @pytest.mark.asyncio
+    async def test_matrix_expands_cross_product(self, mock_boto3, mock_context):
+        """Test that axes are expanded into one query per combination."""
+        axes = {
+            'instanceType': ['t3.medium', 't3.large'],
+            'operatingSystem': ['Linux', 'Windows'],
+        }
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            results = await get_pricing_matrix(mock_context, 'AmazonEC2', 'us-east-1', axes)
+
+        assert len(results) == 4
+        combos = [(r['axes']['instanceType'], r['axes']['operatingSystem']) for r in results]
+        assert ('t3.medium', 'Linux') in combos
+        assert ('t3.large', 'Windows') in combos
+        assert all(r['response']['status'] == 'success' for r in results)
+
+    @pytest.mark.asyncio
+    async def test_matrix_filters_forwarded(self, mock_boto3, mock_context):
+        """Test that each combination's attribute values are sent as filters."""
+        axes = {'instanceType': ['t3.medium']}
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            results = await get_pricing_matrix(mock_context, 'AmazonEC2', 'us-east-1', axes)
+
+        assert results[0]['response']['status'] == 'success'
+
+        pricing_client = mock_boto3.Session().client('pricing')
+        call_args = pricing_client.get_products.call_args[1]
+        filters = {f['Field']: f['Value'] for f in call_args['Filters']}
+        assert filters['instanceType'] == 't3.medium'
+        assert filters['regionCode'] == 'us-east-1'
+
+    @pytest.mark.asyncio
+    async def test_matrix_deduplicates_axis_values(self, mock_boto3, mock_context):
+        """Test that repeated candidate values do not inflate the cross-product."""
+        axes = {'instanceType': ['t3.medium', 't3.medium', 't3.large']}
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            results = await get_pricing_matrix(mock_context, 'AmazonEC2', 'us-east-1', axes)
+
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_matrix_empty_axes(self, mock_boto3, mock_context):
+        """Test that empty axes return an empty result list."""
+        results = await get_pricing_matrix(mock_context, 'AmazonEC2', 'us-east-1', {})
+
+        assert results == []
+
+
+class TestCreateErrorResponse:
+    """Tests for the create_error_response helper."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_errors_logged_once(self, mock_context):
+        """Test that repeated identical errors are only logged once per window."""
+        with patch('awslabs.aws_pricing_mcp_server.server.logger') as mock_logger:
+            first = await create_error_response(mock_context, 'api_error', 'Rate exceeded')
+            second = await create_error_response(mock_context, 'api_error', 'Rate exceeded')
+
+        assert mock_logger.error.call_count == 1
+        # Every caller still gets its error response and context notification
+        assert first['status'] == 'error'
+        assert second['status'] == 'error'
+        assert mock_context.error.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sustained_storm_logged_once_per_window(self, mock_context):
+        """Test that suppressed duplicates do not keep extending the dedup window."""
+        with (
+            patch('awslabs.aws_pricing_mcp_server.server.logger') as mock_logger,
+            patch('awslabs.aws_pricing_mcp_server.server.time') as mock_time,
+        ):
+            # Errors at t=0, t=3 and t=6 with a 5-second window: the third
+            # arrives 6s after the last *logged* occurrence and must be logged
+            mock_time.monotonic.side_effect = [0.0, 3.0, 6.0]
+            for _ in range(3):
+                await create_error_response(mock_context, 'api_error', 'Rate exceeded')
+
+        assert mock_logger.error.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_extra_fields_included_in_response(self, mock_context):
+        """Test that dynamic keyword fields land in the response dict."""
+        response = await create_error_response(
+            mock_context,
+            'empty_results',
+            'No results found',
+            service_code='AmazonEC2',
+            suggestion='Try fewer filters',
+        )
+
+        assert response['status'] == 'error'
+        assert response['error_type'] == 'empty_results'
+        assert response['message'] == 'No results found'
+        assert response['service_code'] == 'AmazonEC2'
+        assert response['suggestion'] == 'Try fewer filters'
+
+    @pytest.mark.asyncio
+    async def test_distinct_errors_all_logged(self, mock_context):
+        """Test that different errors are not deduplicated."""
+        with patch('awslabs.aws_pricing_mcp_server.server.logger') as mock_logger:
+            await create_error_response(mock_context, 'api_error', 'Rate exceeded')
+            await create_error_response(mock_context, 'empty_results', 'No results found')
+
+        assert mock_logger.error.call_count == 2
+
+
 class TestGetBedrockPatterns:
     """Tests for the get_bedrock_patterns function."""
 
@@ -750,7 +1068,7 @@ class TestGetPricingServiceAttributes:
     async def test_get_pricing_service_attributes_client_creation_error(self, mock_context):
         """Test handling of client creation errors."""
         with patch(
-            'awslabs.aws_pricing_mcp_server.server.create_pricing_client',
+            'awslabs.aws_pricing_mcp_server.server.get_default_pricing_client',
             side_effect=Exception('Client creation failed'),
         ):
             result = await get_pricing_service_attributes(mock_context, 'AmazonEC2')
@@ -971,7 +1289,7 @@ class TestGetPricingAttributeValues:
     async def test_get_pricing_attribute_values_client_creation_error(self, mock_context):
         """Test handling of client creation errors."""
         with patch(
-            'awslabs.aws_pricing_mcp_server.server.create_pricing_client',
+            'awslabs.aws_pricing_mcp_server.server.get_default_pricing_client',
             side_effect=Exception('Client creation failed'),
         ):
             result = await get_pricing_attribute_values(
@@ -1031,7 +1349,7 @@ class TestServerIntegration:
     @pytest.mark.parametrize(
         'error_scenario,side_effect,expected_error_type',
         [
-            ('client_creation_failed', 'create_pricing_client', 'client_creation_failed'),
+            ('client_creation_failed', 'get_default_pricing_client', 'client_creation_failed'),
             ('api_error', 'describe_services', 'api_error'),
             ('empty_results', None, 'empty_results'),
         ],
@@ -1042,7 +1360,7 @@ class TestServerIntegration:
         """Test error handling scenarios for get_pricing_service_codes."""
         if error_scenario == 'client_creation_failed':
             with patch(
-                'awslabs.aws_pricing_mcp_server.server.create_pricing_client',
+                'awslabs.aws_pricing_mcp_server.server.get_default_pricing_client',
                 side_effect=Exception('Client creation failed'),
             ):
                 result = await get_pricing_service_codes(mock_context)